@@ -1,9 +1,21 @@
+import sys
+
 from gasofo import Service, provides
-from typing import List
+from typing import Tuple
 
 
 class CoffeeMenu(Service):
 
+    _ITEMS = frozenset(sys.intern(item) for item in [  # for lookup
+        "Black Americano",
+        "White Americano",
+        "Cappucino",
+        "Flat White",
+        "English Breakfast Tea",
+        "Hot Chocolate",
+    ])
+    _SORTED_ITEMS = tuple(sorted(_ITEMS))
+
     @provides
     def is_valid_menu_item(self, item_name: str) -> bool:
         """Determines if the given item is in the menu.
@@ -14,20 +26,9 @@ class CoffeeMenu(Service):
         Returns:
             bool
         """
-        return item_name in self._items()
+        return item_name in self._ITEMS
 
     @provides
-    def get_menu_items(self) -> List[str]:
-        """ Returns a list of all menu items. """
-        return sorted(self._items())  # return a copy
-
-    @staticmethod
-    def _items():
-        return frozenset([  # for lookup
-            "Black Americano",
-            "White Americano",
-            "Cappucino",
-            "Flat White",
-            "English Breakfast Tea",
-            "Hot Chocolate",
-        ])
+    def get_menu_items(self) -> Tuple[str, ...]:
+        """ Returns all menu items, sorted. The tuple is shared across calls and must not be mutated. """
+        return self._SORTED_ITEMS
@@ -55,7 +55,7 @@ class Orders(Service):
         if active_offer and active_offer.buyer == requester:
             raise InvalidAction('You already have an open offer to buy coffee')
         elif active_offer:
-            raise InvalidAction('There is already an offer to by coffee by ' + active_offer.buyer)
+            raise InvalidAction(f'There is already an offer to buy coffee by {active_offer.buyer}')
 
         return self.deps.db_create_order(room=room, buyer=requester)
 
@@ -105,7 +105,7 @@ class Orders(Service):
             raise InvalidAction('There are no open offers in this room')
 
         if not self.deps.is_valid_menu_item(item_name=order_item):
-            raise InvalidAction(order_item + ' is not a valid menu item')
+            raise InvalidAction(f'{order_item} is not a valid menu item')
 
         order_item = self.deps.db_add_order_item(room=room,
                                                  item=order_item,
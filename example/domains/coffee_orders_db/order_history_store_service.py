@@ -21,7 +21,12 @@ class OrderHistoryStore(Service):
     def db_store_closed_order(self, order_details: OrderDetails):
         room = order_details.room
         immutable_order = order_details._replace(orders=list(order_details.orders))
-        self._orders_by_room.setdefault(room, []).append(immutable_order)
+
+        orders_by_room = self._orders_by_room
+        room_orders = orders_by_room.get(room)
+        if room_orders is None:
+            room_orders = orders_by_room[room] = []
+        room_orders.append(immutable_order)
 
     @provides
     def db_get_closed_orders_for_room(self, room: str) -> OrderDetails:
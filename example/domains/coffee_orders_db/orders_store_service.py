@@ -1,5 +1,4 @@
-from copy import deepcopy
-
+from collections import deque
 from typing import Optional
 
 from example.shared.datatypes import (
@@ -42,56 +41,59 @@ class OrdersStore(Service):
         if room in self._orders:
             raise InvalidAction('Order already open for room ' + room)
 
-        order_details = OrderDetails(
+        order_header = OrderDetails(
             order_id=self.deps.get_next_unique_id(),
             buyer=buyer,
             room=room,
-            orders=[],
+            orders=(),  # items are stored separately and only attached when details are read
             open_ts=self.deps.get_current_ts(),
             close_ts=None,
         )
 
-        self._orders[room] = order_details
-        order_summary = self._extract_summary(order_details=order_details)
+        # Header and summary never change while the order is open, so only the items need to be mutable.
+        # Items are only ever appended so a deque is used and converted to list when read.
+        order_summary = self._extract_summary(order_details=order_header)
+        self._orders[room] = (order_header, order_summary, deque())
         return order_summary
 
     @provides_with(name='db_close_order')
     def close_order(self, room: str) -> OrderDetails:
         try:
-            order = self._orders.pop(room)
+            order_header, _, order_items = self._orders.pop(room)
         except KeyError:
             raise InvalidAction('No open orders for room ' + room)
 
-        closed_order = order._replace(close_ts=self.deps.get_current_ts(), orders=list(order.orders))
+        closed_order = order_header._replace(close_ts=self.deps.get_current_ts(), orders=list(order_items))
         return closed_order
 
     @provides_with(name='db_get_active_order')
     def get_active_order(self, room: str) -> Optional[OrderSummary]:
         try:
-            order_details = self._orders[room]
-            return self._extract_summary(order_details)
+            _, order_summary, _ = self._orders[room]
         except KeyError:
             return None
+        return order_summary
 
     @provides_with(name='db_add_order_item')
     def add_order_item(self, room: str, item: str, recipient: str) -> OrderItem:
         try:
-            order_details = self._orders[room]
+            _, _, order_items = self._orders[room]
         except KeyError:
             raise InvalidAction('No open orders for room ' + room)
 
         order_item = OrderItem(item=item, recipient=recipient, order_ts=self.deps.get_current_ts())
-        order_details.orders.append(order_item)
+        order_items.append(order_item)
         return order_item
 
     @provides_with(name='db_get_order_details')
     def get_order_details(self, room: str) -> OrderDetails:
         try:
-            order_details = self._orders[room]
+            order_header, _, order_items = self._orders[room]
         except KeyError:
             raise InvalidAction('No open orders for room ' + room)
 
-        return deepcopy(order_details)
+        # OrderItem is immutable so only the list of items needs copying to guard against mutation
+        return order_header._replace(orders=list(order_items))
 
     @property
     def _orders(self):
@@ -1,5 +1,4 @@
-import calendar
-import datetime
+import time
 
 from gasofo import func_as_provider
 
@@ -9,9 +8,7 @@ class Clock(object):
 
     @staticmethod
     def get_current_ts():
-        now = datetime.datetime.utcnow()
-        ts = calendar.timegm(now.utctimetuple())
-        return ts
+        return int(time.time())  # POSIX timestamp in seconds, same as timegm(utcnow().utctimetuple())
 
 
 def get_clock_provider():
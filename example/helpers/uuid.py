@@ -1,19 +1,35 @@
-import itertools
+from collections import deque
 
 from gasofo import object_as_provider
 
 
 class UuidGenerator(object):
-    """Simple object that emits UUIDs."""
+    """Simple object that emits UUIDs.
 
-    def __init__(self, prefix='ID', start=1, width=10):
+    IDs are minted in batches and handed out from a pool to keep the per-call cost down.
+    """
+
+    def __init__(self, prefix='ID', start=1, width=10, batch_size=1024):
         super(UuidGenerator, self).__init__()
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
         self.prefix = prefix
-        self.counter = itertools.count(start=start)
-        self.template = '{0}{1:0%dd}' % width
+        self.width = width
+        self.batch_size = batch_size
+        self._next_start = start
+        self._pool = deque()
 
     def get_next_unique_id(self):
-        return self.template.format(self.prefix, next(self.counter))
+        pool = self._pool
+        if not pool:
+            self._refill()
+        return pool.popleft()
+
+    def _refill(self):
+        start = self._next_start
+        self._next_start = end = start + self.batch_size
+        prefix, width = self.prefix, self.width
+        self._pool.extend(['%s%0*d' % (prefix, width, i) for i in range(start, end)])
 
     def as_provider(self):
         """Wrap this object as a provider so it can be wired to Domains/Services."""
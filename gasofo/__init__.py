@@ -1,25 +1,30 @@
-from gasofo.convenience import (
-    func_as_provider,
-    object_as_provider,
-)
-from gasofo.discoverable import (
-    INeed,
-    IProvide,
-    auto_wire,
-)
-from gasofo.domain import (
-    AutoProvide,
-    Domain,
-)
-from gasofo.service import (
-    Service,
-    provides,
-    provides_with,
-)
-from gasofo.service_needs import (
-    Needs,
-    NeedsInterface,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from gasofo._lazy import lazy_module_attributes as _lazy_module_attributes
+
+if _TYPE_CHECKING:  # pragma: no cover  (let IDEs and type checkers see the lazily loaded names)
+    from gasofo.convenience import (
+        func_as_provider,
+        object_as_provider,
+    )
+    from gasofo.discoverable import (
+        INeed,
+        IProvide,
+        auto_wire,
+    )
+    from gasofo.domain import (
+        AutoProvide,
+        Domain,
+    )
+    from gasofo.service import (
+        Service,
+        provides,
+        provides_with,
+    )
+    from gasofo.service_needs import (
+        Needs,
+        NeedsInterface,
+    )
 
 __all__ = [
     'auto_wire',
@@ -35,3 +40,21 @@ __all__ = [
     'object_as_provider',
     'func_as_provider',
 ]
+
+# Submodules are only imported when one of their public names is first accessed so `import gasofo` stays cheap.
+_LAZY_IMPORTS = {
+    'auto_wire': 'gasofo.discoverable',
+    'INeed': 'gasofo.discoverable',
+    'IProvide': 'gasofo.discoverable',
+    'AutoProvide': 'gasofo.domain',
+    'Domain': 'gasofo.domain',
+    'Service': 'gasofo.service',
+    'provides': 'gasofo.service',
+    'provides_with': 'gasofo.service',
+    'Needs': 'gasofo.service_needs',
+    'NeedsInterface': 'gasofo.service_needs',
+    'func_as_provider': 'gasofo.convenience',
+    'object_as_provider': 'gasofo.convenience',
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS, __all__)
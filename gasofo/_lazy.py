@@ -0,0 +1,42 @@
+import importlib as _importlib
+import sys
+from typing import (
+    Callable,
+    Iterable,
+    Mapping,
+    Tuple,
+)
+
+
+def lazy_module_attributes(module_name: str,
+                           lazy_imports: Mapping[str, str],
+                           public_names: Iterable[str]) -> Tuple[Callable, Callable]:
+    """Builds the module level __getattr__ and __dir__ (PEP 562) for a package whose public names are loaded lazily.
+
+    lazy_imports maps each lazily loaded name to the module it should be imported from.
+    """
+    public_names = frozenset(public_names)
+
+    def __getattr__(name):
+        source_module_name = lazy_imports.get(name)
+        if source_module_name is None:
+            return _import_submodule(name)
+
+        value = getattr(_importlib.import_module(source_module_name), name)
+        setattr(sys.modules[module_name], name, value)  # cache so subsequent lookups do not go through __getattr__
+        return value
+
+    def _import_submodule(name):
+        # submodules remain reachable as attributes of the package, as they were when it imported them eagerly
+        submodule_name = '{}.{}'.format(module_name, name)
+        try:
+            return _importlib.import_module(submodule_name)
+        except ModuleNotFoundError as e:
+            if e.name != submodule_name:  # the submodule exists but failed to import something itself
+                raise
+        raise AttributeError('module {!r} has no attribute {!r}'.format(module_name, name))
+
+    def __dir__():
+        return sorted(public_names.union(vars(sys.modules[module_name])))
+
+    return __getattr__, __dir__
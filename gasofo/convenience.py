@@ -1,3 +1,4 @@
+import sys
 from typing import (
     Callable,
     List,
@@ -20,8 +21,10 @@ def func_as_provider(func, port):
 
 
 class _FlagQueryMixin:
+    __slots__ = ('_ports',)
+
     def __init__(self, valid_ports):
-        self._ports = valid_ports
+        self._ports = frozenset(valid_ports)
 
     def get_provider_flag(self, port_name, __):
         self._assert_valid_port(port_name)
@@ -38,12 +41,13 @@ class _FlagQueryMixin:
 
 class AdHocFuncProvider(_FlagQueryMixin, IProvide):
     """Wraps a single callable so it can be published as a provider with a specific port name."""
+    __slots__ = ('provider', 'port_name')
 
     def __init__(self, provider: Callable, port_name: str):
         PortArray.assert_valid_port_name(port_name)
         self.provider = provider
-        self.port_name = port_name
-        _FlagQueryMixin.__init__(self, valid_ports=[port_name])
+        self.port_name = sys.intern(port_name)
+        _FlagQueryMixin.__init__(self, valid_ports=(self.port_name,))
 
     def get_provides(self) -> List[str]:
         return [self.port_name]
@@ -57,21 +61,25 @@ class AdHocFuncProvider(_FlagQueryMixin, IProvide):
 
 class AdHocObjectProvider(_FlagQueryMixin, IProvide):
     """Wraps an object so it can be published as a provider with some of its attributes exposed as ports."""
+    __slots__ = ('provider', 'ports', '_sorted_ports')
+
     def __init__(self, provider: object, ports: List[str]):
         if isinstance(ports, str):
             ports = [ports]
 
-        self._assert_attr_exists_on_provider(provider, ports)
-
-        for port_name in ports:
+        valid_ports = []
+        for port_name in ports:  # single pass so ports can be any iterable
+            self._assert_attr_exists_on_provider(provider, port_name)
             PortArray.assert_valid_port_name(port_name)
+            valid_ports.append(sys.intern(port_name))
 
         self.provider = provider
-        self.ports = frozenset(ports)
+        self.ports = frozenset(valid_ports)
+        self._sorted_ports = tuple(sorted(self.ports))
         _FlagQueryMixin.__init__(self, valid_ports=self.ports)
 
     def get_provides(self) -> List[str]:
-        return sorted(self.ports)
+        return list(self._sorted_ports)
 
     def get_provider_func(self, port_name: str) -> Callable:
         if port_name not in self.ports:
@@ -79,12 +87,11 @@ class AdHocObjectProvider(_FlagQueryMixin, IProvide):
         return getattr(self.provider, port_name)
 
     @staticmethod
-    def _assert_attr_exists_on_provider(provider, ports):
-        for port in ports:
-            try:
-                target = getattr(provider, port)
-            except AttributeError:
-                raise YouCannotDoThat('"{}" is not an attribute of {}'.format(port, provider))
-
-            if not callable(target):
-                raise YouCannotDoThat('{}.{} is not callable'.format(provider, port))
+    def _assert_attr_exists_on_provider(provider, port):
+        try:
+            target = getattr(provider, port)
+        except AttributeError:
+            raise YouCannotDoThat('"{}" is not an attribute of {}'.format(port, provider))
+
+        if not callable(target):
+            raise YouCannotDoThat('{}.{} is not callable'.format(provider, port))
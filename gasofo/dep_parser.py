@@ -3,32 +3,68 @@ import inspect
 import os
 import re
 import textwrap
-from shlex import shlex
-from types import FunctionType
+from types import (
+    CodeType,
+    FunctionType,
+)
 from typing import (
     FrozenSet,
     List,
     Optional,
 )
+from weakref import WeakKeyDictionary
 
 USE_OLD_DEP_PARSER = 'GASOFO_USE_OLD_DEP_PARSER' in os.environ
 
 
+# port names are matched as identifiers (no backtracking) and must not be part of a longer attribute chain
+DEPS_CALL_PATTERN = re.compile(r'(?<![\w.])self\.deps\.([A-Za-z_]\w*)\s*[\(,]')
+
+# String literals (including triple-quoted ones) are matched first so a "#" within a string is not taken as a comment.
+# The prefix is captured so the replacement fields of f-strings, which are code, can be kept.
+COMMENTS_AND_STRINGS_PATTERN = re.compile(
+    r'''(?P<prefix>\b[rRbBuUfF]{1,2})?'''
+    r'''(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')|#[^\n]*'''
+)
+
+# replacement fields within an f-string, once escaped braces ("{{" and "}}") have been dropped
+FSTRING_FIELD_PATTERN = re.compile(r'\{([^{}]*)\}')
+
+
 def parse_deps_used_old(method: FunctionType) -> FrozenSet[str]:
     # Start simple for now. Match using regex instead of walking parsed ast tree.
-    method_source = discard_comments_and_newlines(textwrap.dedent(inspect.getsource(method)))
-    deps_used = re.findall(r'self\.deps\.(.+?)[\(,]', method_source)
+    method_source = inspect.getsource(method)
+    if 'self.deps.' not in method_source:
+        return frozenset()
+
+    method_source = discard_comments_and_string_literals(method_source)
+    deps_used = DEPS_CALL_PATTERN.findall(method_source)
     return frozenset(deps_used)
 
 
-def discard_comments_and_newlines(source: str) -> str:
-    lex = shlex(source, posix=True)
-    lex.whitespace = '\n'
-    return ''.join(lex)
+def discard_comments_and_string_literals(source: str) -> str:
+    return COMMENTS_AND_STRINGS_PATTERN.sub(_blank_out_comment_or_string, source)
+
+
+def _blank_out_comment_or_string(match) -> str:
+    token = match.group()
+    if token.startswith('#'):
+        return ''
+
+    prefix = match.group('prefix') or ''
+    if 'f' not in prefix.lower():
+        return '""'
+
+    # keep the code within replacement fields, which may itself contain comments or strings to discard
+    body = token.replace('{{', '').replace('}}', '')
+    fields = FSTRING_FIELD_PATTERN.findall(body)
+    return ' '.join(['""'] + [discard_comments_and_string_literals(field) for field in fields])
 
 
 def parse_deps_used_new(method: FunctionType) -> FrozenSet[str]:
-    method_source = textwrap.dedent(inspect.getsource(method))
+    method_source = inspect.getsource(method)
+    if method_source[:1].isspace():  # top-level functions start at column 0 so need no dedent
+        method_source = textwrap.dedent(method_source)
     ast_tree = ast.parse(method_source)
     dep_finder = DepCallFinder()
     dep_finder.visit(ast_tree)
@@ -36,24 +72,54 @@ def parse_deps_used_new(method: FunctionType) -> FrozenSet[str]:
     return frozenset(dep_finder.deps_calls)
 
 
-parse_deps_used = parse_deps_used_old if USE_OLD_DEP_PARSER else parse_deps_used_new
+_parse_deps_used = parse_deps_used_old if USE_OLD_DEP_PARSER else parse_deps_used_new
+
+# Results are keyed on code objects (rather than functions) so functions that share code, e.g. the same function
+# attached to multiple classes, share cache entries. We key on the code of the unwrapped function since that is where
+# inspect.getsource() gets its source from; wrappers created by a decorator all share the wrapper's code.
+# Weak keys so methods of classes defined within tests can still be collected.
+_deps_used_cache: 'WeakKeyDictionary[CodeType, FrozenSet[str]]' = WeakKeyDictionary()
+
 
+def parse_deps_used(method: FunctionType) -> FrozenSet[str]:
+    code = getattr(inspect.unwrap(method), '__code__', None)
+    if code is None:  # not a plain function so we have nothing sensible to key on
+        return _parse_deps_used(method)
 
-class FoundChainedCall(Exception):
-    pass
+    deps_used = _deps_used_cache.get(code)
+    if deps_used is None:
+        if _code_references_deps(code):
+            deps_used = _parse_deps_used(method)
+        else:  # "self.deps.x()" cannot appear in the source if "deps" is never looked up, so don't bother reading it
+            deps_used = frozenset()
+        _deps_used_cache[code] = deps_used
+    return deps_used
+
+
+def _code_references_deps(code: CodeType) -> bool:
+    if 'deps' in code.co_names:
+        return True
+    # inner functions, lambdas and comprehensions are compiled to separate code objects stored as constants
+    return any(isinstance(const, CodeType) and _code_references_deps(const) for const in code.co_consts)
 
 
 def extract_call_attribute_chain(node: ast.Attribute) -> Optional[List[str]]:
     """
     Attribute(value=Attribute(value=Name(id='self', ...), attr='deps', ...), attrs='x', ...) ==> ['self', 'deps', 'x' ]
+
+    Returns None if the chain does not start with a plain name, e.g. chained calls such as a().b()
     """
-    if not isinstance(node, ast.Attribute):
-        raise FoundChainedCall()
+    chain = []
+    while isinstance(node, ast.Attribute):
+        chain.append(node.attr)
+        node = node.value
+
+    if not isinstance(node, ast.Name):
+        return None
 
-    if isinstance(node.value, ast.Name):
-        return [node.value.id, node.attr]
-    else:
-        return extract_call_attribute_chain(node.value) + [node.attr]
+    chain.append(node.id)
+    chain.reverse()
+    return chain
 
 
 class DepCallFinder(ast.NodeVisitor):
@@ -63,23 +129,10 @@ class DepCallFinder(ast.NodeVisitor):
     def visit_Call(self, node):
         # all deps call starts with "self.deps." so we only need to handle func calls that are referenced via attributes
         if isinstance(node.func, ast.Attribute):
-            try:
-                attr_chain = extract_call_attribute_chain(node.func)
-            except FoundChainedCall:
-                self.visit(node.func)
-                attr_chain = None
-
-            if attr_chain:
-                assert len(attr_chain) > 1  # sanity check
-                func_name = attr_chain[-1]
-                ref = '.'.join(attr_chain[:-1])
-
-                if ref == 'self.deps':
-                    self.deps_calls.add(func_name)
-
-        # Func args could contain more func calls, so make sure we visit args/kwargs too. e.g. a(b=c(), d={'yo': e()})
-        for func_arg in node.args:
-            self.visit(func_arg)
-        for func_kwarg in node.keywords:
-            self.visit(func_kwarg)
+            attr_chain = extract_call_attribute_chain(node.func)
+            if attr_chain and len(attr_chain) == 3 and attr_chain[0] == 'self' and attr_chain[1] == 'deps':
+                self.deps_calls.add(attr_chain[2])
 
+        # Func and args could contain more func calls, so make sure we visit all children too.
+        # e.g. self.deps.a().b(), a(b=c(), d={'yo': e()})
+        self.generic_visit(node)
@@ -1,4 +1,8 @@
-from collections import namedtuple
+from collections import defaultdict
+from typing import (
+    Any,
+    NamedTuple,
+)
 
 from gasofo.exceptions import (
     DisconnectedPort,
@@ -10,6 +14,8 @@ from gasofo.exceptions import (
 
 
 class IProvide:
+    __slots__ = ()  # so slotted providers do not pick up a __dict__ from this interface
+
     def get_provides(self):  # pragma: no cover
         raise NotImplementedError('Implement me to return list of Provides port names')
 
@@ -52,30 +58,41 @@ class INeed:
             raise DisconnectedPort('"{}" has not been assigned a provider'.format(port_name))
 
 
-DiscoveredConnection = namedtuple('DiscoveredConnection', 'port_name consumer provider')
+class DiscoveredConnection(NamedTuple):
+    port_name: str
+    consumer: Any  # components may be instances or Service/Domain classes
+    provider: Any
 
 
 class AutoDiscoverConnections:
 
     def __init__(self, components):
         self._components = components
-        self._needs = self._gather_needs(components)
-        self._provides = self._gather_provides(components)
+        self._needs, self._provides = self._gather_needs_and_provides(components)
         self.assert_no_components_satisfying_themselves(self._needs, self._provides)
 
+        # connections are fixed once discovered, so sort once and hand out copies
+        self._sorted_needs = tuple(sorted(self._needs))
+        self._sorted_provides = tuple(sorted(self._provides))
+        self._unsatisfied_needs = tuple(sorted(self._needs.keys() - self._provides.keys()))
+        self._satisfied_needs = tuple(sorted(self._needs.keys() & self._provides.keys()))
+
     def get_needs(self):
-        return sorted(self._needs.keys())
+        return list(self._sorted_needs)
 
     def get_provides(self):
-        return sorted(self._provides.keys())
+        return list(self._sorted_provides)
 
     def unsatisfied_needs(self):
-        unsatisfied = set(self._needs).difference(self._provides)
-        return sorted(unsatisfied)
+        return list(self._unsatisfied_needs)
 
     def satisfied_needs(self):
-        satisfied = set(self._needs).intersection(self._provides)
-        return sorted(satisfied)
+        return list(self._satisfied_needs)
+
+    def unsatisfied_needs_items(self):
+        """Returns (port_name, consumers) pairs for unsatisfied needs, sorted by port name."""
+        needs = self._needs
+        return [(port, list(needs[port])) for port in self._unsatisfied_needs]
 
     def get_provider(self, port_name):
         try:
@@ -84,33 +101,32 @@ class AutoDiscoverConnections:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
 
     def connections(self):
-        for port in self._needs:
-            provider = self._provides.get(port, None)
-            if not provider:
+        provides = self._provides
+        for port, consumers in self._needs.items():  # iterate needs so wiring order remains deterministic
+            provider = provides.get(port)
+            if provider is None:
                 continue
-            for consumer in self._needs[port]:
+            for consumer in consumers:
                 yield DiscoveredConnection(port_name=port, consumer=consumer, provider=provider)
 
     @staticmethod
-    def _gather_needs(components):
-        needs = {}
-        needy_components = (c for c in components if hasattr(c, 'get_needs'))
-        for component in needy_components:
-            for port in component.get_needs():
-                needs.setdefault(port, []).append(component)
-        return needs
-
-    @staticmethod
-    def _gather_provides(components):
+    def _gather_needs_and_provides(components):
+        needs = defaultdict(list)
         provides = {}
-        provider_components = (c for c in components if hasattr(c, 'get_provides'))
-        for component in provider_components:
-            for port in component.get_provides():
-                if port in provides:
-                    msg = 'Duplicate providers for "{}" - {} and {}'.format(port, component, provides[port])
-                    raise DuplicateProviders(msg)
-                provides[port] = component
-        return provides
+        for component in components:
+            get_needs = getattr(component, 'get_needs', None)
+            if get_needs is not None:
+                for port in get_needs():
+                    needs[port].append(component)
+
+            get_provides = getattr(component, 'get_provides', None)
+            if get_provides is not None:
+                for port in get_provides():
+                    if port in provides:
+                        msg = 'Duplicate providers for "{}" - {} and {}'.format(port, component, provides[port])
+                        raise DuplicateProviders(msg)
+                    provides[port] = component
+        return dict(needs), provides
 
     @staticmethod
     def assert_no_components_satisfying_themselves(needs, provides):
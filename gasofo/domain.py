@@ -1,16 +1,18 @@
 import inspect
 import re
 from functools import wraps
+from operator import attrgetter
 from typing import (
+    Callable,
     Dict,
     Type,
 )
+from weakref import WeakKeyDictionary
 
 from gasofo.discoverable import (
     AutoDiscoverConnections,
     INeed,
     IProvide,
-    wire_up_discovered_connections,
 )
 from gasofo.exceptions import (
     DomainDefinitionError,
@@ -28,14 +30,31 @@ from gasofo.service import (
     unknown_interface,
 )
 
-GENERIC_ARGSPEC = inspect.getfullargspec(unknown_interface)
+
+ALLOWED_DOMAIN_ATTRS = frozenset(('__provides__', '__services__'))
+
+
+# Weak keys so template funcs of classes defined within tests can still be collected.
+_argspec_cache: 'WeakKeyDictionary[Callable, inspect.FullArgSpec]' = WeakKeyDictionary()
+
+
+def _get_argspec(func) -> inspect.FullArgSpec:
+    """Template funcs are shared by every component that needs the same port so their argspecs are cached."""
+    try:
+        return _argspec_cache[func]
+    except KeyError:
+        argspec = _argspec_cache[func] = inspect.getfullargspec(func)
+    except TypeError:  # not weak-referenceable so cannot be cached
+        argspec = inspect.getfullargspec(func)
+    return argspec
 
 
 class DomainProviderMetadata(ProviderMetadata[Type[IProvide]]):
     """ meta that references provider classes """
+    __slots__ = ()
 
     def get_provider_method_name(self, port_name: str) -> str:
-        if port_name not in self.get_provides():
+        if port_name not in self._providers:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
         else:
             return port_name
@@ -43,13 +62,13 @@ class DomainProviderMetadata(ProviderMetadata[Type[IProvide]]):
 
 class DomainInstanceProviderMetadata(ProviderMetadata[IProvide]):
     """ meta that references provider instances """
+    __slots__ = ('ports',)
 
     def __init__(self,  meta: DomainProviderMetadata, service_map: Dict[Type[IProvide], IProvide]):
         super(DomainInstanceProviderMetadata, self).__init__()
         self.ports = PortArray()
         
-        for port in meta.get_provides():
-            provider_class = meta.get_provider(port)
+        for port, provider_class in meta._providers.items():
             provider_instance = service_map[provider_class]
             provider_flags = provider_instance.get_provider_flags(port_name=port)
 
@@ -58,10 +77,10 @@ class DomainInstanceProviderMetadata(ProviderMetadata[IProvide]):
 
             # create and connect ports
             self.ports.add_port(port_name=port)
-            self.ports.connect_port(port_name=port, func=provider_func)
+            self.ports._connect_port_unchecked(port_name=port, func=provider_func)
 
     def get_provider_method_name(self, port_name: str) -> str:
-        if port_name not in self.get_provides():
+        if port_name not in self._providers:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
         else:
             return port_name
@@ -74,10 +93,11 @@ def generate_domain_method(port_name, provider):
     provider_func = getattr(provider, provider_method_name)
 
     # TODO: inherit argspec from service ports. (and what can we do about type hints?)
+    get_port = attrgetter('meta.ports.' + port_name)
+
     @wraps(provider_func)
     def generated(self, *args, **kwargs):
-        port = getattr(self.meta.ports, port_name)
-        return port(*args, **kwargs)
+        return get_port(self)(*args, **kwargs)
 
     # generated.__doc__ = provider_func.__doc__
     generated.__name__ = port_name
@@ -90,7 +110,8 @@ class AutoProvide:
         self.matcher = re.compile(pattern) if pattern else None
 
     def filter(self, port_names):
-        return [port for port in port_names if self.acceptable_port_name(port)]
+        acceptable = self.acceptable_port_name
+        return [port for port in port_names if acceptable(port)]
 
     def acceptable_port_name(self, port_name):
         if not self.matcher:
@@ -124,8 +145,9 @@ class DomainMetaclass(type):
                 auto_provider = provides
                 provides_ports = auto_provider.filter(discovered.get_provides())
             else:
+                discovered_provides = frozenset(discovered.get_provides())
                 for port_name in provides:
-                    if port_name not in discovered.get_provides():
+                    if port_name not in discovered_provides:
                         msg = '"{}" listed in {}.__provides__ is not provided by any of the services'.format(
                             port_name,
                             name,
@@ -133,21 +155,18 @@ class DomainMetaclass(type):
                         raise DomainDefinitionError(msg)
                 provides_ports = provides
 
-        # all unsatisfied deps are exposed as dependencies of the domain
-        state['deps'] = deps = PortArray()
-        for port_name in discovered.unsatisfied_needs():
-            deps.add_port(port_name)
-
-        # make a shadow copy of template_funcs. Used mainly for tracking intended interfaces for ports so we can
-        # use for validation during testing. At some point we might use this for wiring-time checks too to ensure
+        # all unsatisfied deps are exposed as dependencies of the domain.
+        # We also make a shadow copy of template_funcs. Used mainly for tracking intended interfaces for ports so we
+        # can use for validation during testing. At some point we might use this for wiring-time checks too to ensure
         # compatibility between ports.
+        state['deps'] = deps = PortArray()
         deps._needs_template_funcs = template_funcs = {}
-        for port in deps.get_ports():
-            template_func = mcs._assert_providers_compatible_and_extract_template_func(
-                providers=discovered._needs[port],
-                port_name=port,
-            )
-            template_funcs[port] = template_func
+        extract_template_func = mcs._assert_providers_compatible_and_extract_template_func
+        needs_ports = []
+        for port_name, consumers in discovered.unsatisfied_needs_items():
+            deps.add_port(port_name)
+            needs_ports.append(port_name)
+            template_funcs[port_name] = extract_template_func(providers=consumers, port_name=port_name)
 
         # declared 'provides' ports are registered and entry points created
         state['meta'] = meta = DomainProviderMetadata()
@@ -161,16 +180,27 @@ class DomainMetaclass(type):
                 )
                 raise DomainDefinitionError(msg)
 
-            inherited_flags = provider.get_provider_flags(port)
-            inherited_flags.pop('with_name', None)  # don't inherit name-change flags
+            # don't inherit name-change flags
+            inherited_flags = {k: v for k, v in provider.get_provider_flags(port).items() if k != 'with_name'}
             meta.register_provider(port_name=port, provider=provider, flags=inherited_flags)
             state[port] = generate_domain_method(port_name=port, provider=provider)
 
+        # ports are fixed once the class is created
+        state['_gasofo_needs'] = tuple(needs_ports)
+        state['_gasofo_provides'] = tuple(meta.get_provides())
+
+        # needs/provides of services are defined per class, so connections between them are the same for every
+        # instance of this domain. Record them once so instances can be wired up without rediscovering them.
+        # A service listed twice maps to a single instance, so repeated connections of needs-only services are
+        # collapsed here (duplicated providers have already been rejected by AutoDiscoverConnections).
+        state['_gasofo_internal_connections'] = tuple(dict.fromkeys(discovered.connections()))
+        state['_gasofo_satisfied_needs'] = tuple(discovered.satisfied_needs())
+
         return type.__new__(mcs, name, bases, state)
 
     @classmethod
     def _assert_is_compatible_class(mcs, name, service_class):
-        if not inspect.isclass(service_class):
+        if not isinstance(service_class, type):
             raise DomainDefinitionError('{}.__services__ should contain component classes not instances. Got {}'.format(
                 name,
                 service_class,
@@ -189,9 +219,7 @@ class DomainMetaclass(type):
         if '__init__' in attrs:
             raise DomainDefinitionError('{} has custom constructor which is not allowed for Domains'.format(class_name))
 
-        allowed_attrs = {'__provides__', '__services__'}
-        non_underscored_attrs = (attr for attr in attrs if not attr.startswith('_'))
-        bad_attrs = [attr for attr in non_underscored_attrs if attr not in allowed_attrs]
+        bad_attrs = [attr for attr in attrs if not attr.startswith('_') and attr not in ALLOWED_DOMAIN_ATTRS]
         if bad_attrs:
             raise DomainDefinitionError((
                 'Domains cannot be defined with custom methods or attributes. '
@@ -202,28 +230,39 @@ class DomainMetaclass(type):
     def _assert_providers_compatible_and_extract_template_func(providers, port_name):
         assert providers, 'why are you calling me if there are no providers for {}?'.format(port_name)
 
-        func_map = {}
-        spec_map = {}
+        generic_argspec = _get_argspec(unknown_interface)
+        first_func = None
+        chosen_func = chosen_spec = None
+        non_generic_providers = []
+        consistent = True
 
+        # single pass, comparing each spec against the first non-generic one (argspecs hold dicts so can't be hashed)
         for provider in providers:
-            func_map[provider] = func = get_template_funcs(provider)[port_name]
-            spec_map[provider] = inspect.getfullargspec(func)
+            func = get_template_funcs(provider)[port_name]
+            if first_func is None:
+                first_func = func
 
-        non_generic_specs = {provider: spec for provider, spec in spec_map.items() if spec != GENERIC_ARGSPEC}
+            spec = _get_argspec(func)
+            if spec == generic_argspec:
+                continue
 
-        if not non_generic_specs:  # all needs of this port did not specific an interface
-            return next(iter(func_map.values()))  # just return the first one
+            non_generic_providers.append(provider)
+            if chosen_func is None:
+                chosen_func, chosen_spec = func, spec
+            elif spec != chosen_spec:
+                consistent = False
 
-        specs = list(non_generic_specs.values())
-        if not all(spec == specs[0] for spec in specs):  # we have a mixture of specs
+        if chosen_func is None:  # all needs of this port did not specific an interface
+            return first_func  # just return the first one
+
+        if not consistent:  # we have a mixture of specs
             msg = 'The following components all need "{}" but expect different interfaces - {}'.format(
                 port_name,
-                ', '.join(sorted(p.__name__ for p in non_generic_specs.keys()))
+                ', '.join(sorted(p.__name__ for p in non_generic_providers))
             )
             raise InconsistentInterface(msg)
         else:
-            chosen_one = next(iter(non_generic_specs))
-            return func_map[chosen_one]
+            return chosen_func
 
 
 class Domain(INeed, IProvide, metaclass=DomainMetaclass):
@@ -232,22 +271,34 @@ class Domain(INeed, IProvide, metaclass=DomainMetaclass):
     """
     __services__ = ()  # must be overridden in subclass to define list of services within this domain
     __provides__ = ()  # must be overridden to expose ports that this domain provides
+    _gasofo_needs = ()  # populated by metaclass with the final list of needs ports
+    _gasofo_provides = ()  # populated by metaclass with the final list of provides ports
+    _gasofo_internal_connections = ()  # populated by metaclass with connections between services within the domain
+    _gasofo_satisfied_needs = ()  # populated by metaclass with needs ports satisfied within the domain
 
     def __init__(self):
         super(Domain, self).__init__()
         self._service_map = service_map = self._instantiate_and_map_services()
 
         # replace 'meta' with a variant for the instance (don't share self.__class__.meta)
-        self.meta = DomainInstanceProviderMetadata(meta=self.__class__.meta, service_map=service_map)
+        self.meta = meta = DomainInstanceProviderMetadata(meta=self.__class__.meta, service_map=service_map)
+
+        # provides ports are never reconnected so shadow the generated class methods with the provider funcs, which
+        # saves a lookup via self.meta.ports on every call
+        for port_name in self._gasofo_provides:
+            setattr(self, port_name, getattr(meta.ports, port_name))
 
         # replace 'deps' with a ShadowPortArray which serves as proxy to the deps of internal services
-        components = list(service_map.values())
-        component_deps = [c.deps for c in components if isinstance(getattr(c, 'deps', None), (PortArray, ShadowPortArray))]
-        discovered = AutoDiscoverConnections(components=components)
-        self.deps = ShadowPortArray(arrays=component_deps, ignore_ports=discovered.satisfied_needs())
+        component_deps = []
+        for component in service_map.values():
+            component_deps_array = getattr(component, 'deps', None)
+            if isinstance(component_deps_array, (PortArray, ShadowPortArray)):
+                component_deps.append(component_deps_array)
+        self.deps = ShadowPortArray(arrays=component_deps, ignore_ports=self._gasofo_satisfied_needs)
 
         # materialize connections between services
-        wire_up_discovered_connections(discovered=discovered)
+        for port_name, consumer_class, provider_class in self._gasofo_internal_connections:
+            service_map[consumer_class].set_provider(port_name=port_name, provider=service_map[provider_class])
 
     def _instantiate_and_map_services(self):
         mapper = {service_class: service_class() for service_class in self.__services__}
@@ -256,7 +307,7 @@ class Domain(INeed, IProvide, metaclass=DomainMetaclass):
     # ---- implement INeed ----
     @classmethod
     def get_needs(cls):
-        return cls.deps.get_ports()
+        return list(cls._gasofo_needs)
 
     def _is_compatible_provider(self, port_name, provider):
         return True  # no flag checking for now
@@ -268,7 +319,7 @@ class Domain(INeed, IProvide, metaclass=DomainMetaclass):
 
     @classmethod
     def get_provides(cls):
-        return cls.meta.get_provides()
+        return list(cls._gasofo_provides)
 
     def get_provider_func(self, port_name):
         provider = self.meta.get_provider(port_name=port_name)
@@ -1,7 +1,8 @@
-import re
-from functools import partial
+import sys
+from collections import defaultdict
 from typing import (
     Callable,
+    Dict,
     List,
     Optional,
     Set,
@@ -16,8 +17,6 @@ from gasofo.exceptions import (
     WiringError,
 )
 
-VALID_PORT_NAME_FORMAT = re.compile(r'[a-z][a-zA-Z0-9_]*$')
-
 RESERVED_PORT_NAMES = frozenset((
     'meta',
     'deps',
@@ -36,14 +35,16 @@ RESERVED_PORT_NAMES = frozenset((
 
 class PortArray:
     def __init__(self):
-        self._ports = set()
+        # only names are held here, funcs live on the instance attributes. A dict so ports keep declaration order.
+        self._ports: Dict[str, None] = {}
 
     def add_port(self, port_name: str):
         self.assert_valid_port_name(port_name)
+        port_name = sys.intern(port_name)  # used as a dict key wherever the port is looked up
         if port_name in self._ports:
             raise DuplicatePortDefinition('Port "{}" already defined'.format(port_name))
 
-        self._ports.add(port_name)
+        self._ports[port_name] = None
         # TODO: generate func that inherits argspec from a template func (if one is provided)
         raise_not_connected = self._get_placeholder_func_for_disconnected_port(port_name=port_name)
         setattr(self, port_name, raise_not_connected)
@@ -58,6 +59,11 @@ class PortArray:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
         setattr(self, port_name, func)
 
+    def _connect_port_unchecked(self, port_name: str, func: Callable):
+        """Internal variant of connect_port for callers that have just added the port and hold a bound method."""
+        assert port_name in self._ports and callable(func)
+        setattr(self, port_name, func)
+
     def disconnect_port(self, port_name: str):
         if port_name not in self._ports:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
@@ -66,38 +72,47 @@ class PortArray:
 
     @staticmethod
     def _get_placeholder_func_for_disconnected_port(port_name: str):
-        func = partial(not_yet_connected, port_name)
-        setattr(func, 'disconnected', True)  # used to identify if func is a placeholder for disconnected ports
-        return func
+        return DisconnectedPortPlaceholder(port_name)
 
     def is_disconnected_port(self, port_name: str) -> bool:
         if port_name not in self._ports:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
-        port = getattr(self, port_name)
-        return getattr(port, 'disconnected', False)
+        return isinstance(getattr(self, port_name), DisconnectedPortPlaceholder)
 
     @classmethod
     def replicate(cls, another_port_array: 'PortArray') -> 'PortArray':
         new_array = cls()
-        for port in another_port_array.get_ports():
-            new_array.add_port(port)
+        for port in another_port_array.get_ports():  # names were validated when added to the source array
+            new_array._ports[port] = None
+            setattr(new_array, port, DisconnectedPortPlaceholder(port))
         return new_array
 
     @staticmethod
     def assert_valid_port_name(port_name: str):
-        if not VALID_PORT_NAME_FORMAT.match(port_name):
-            raise InvalidPortName('"{}" does not have required format for port names'.format(port_name))
-
         if port_name in RESERVED_PORT_NAMES:
             raise InvalidPortName('"{}" is a reserved word and cannot be used as port name'.format(port_name))
 
+        # equivalent to matching [a-z][a-zA-Z0-9_]* but without going through the regex engine
+        if not (port_name.isascii() and port_name.isidentifier() and port_name[0].islower()):
+            raise InvalidPortName('"{}" does not have required format for port names'.format(port_name))
+
+
+class DisconnectedPortPlaceholder:
+    """Stands in for the func of a port that has not been connected. Raises DisconnectedPort when called."""
+    __slots__ = ('port_name',)
+    disconnected = True
 
-def not_yet_connected(port_name: str, *_, **__):
-    raise DisconnectedPort('Port "{}" has not been connected'.format(port_name))
+    def __init__(self, port_name: str):
+        self.port_name = port_name
+
+    def __call__(self, *_, **__):
+        raise DisconnectedPort('Port "{}" has not been connected'.format(self.port_name))
 
 
 class ShadowPortArray:
     """Fronts a group of PortArrays and passes on operations to relevant child array."""
+    __slots__ = ('ignored_ports', '_children', '_ports')
+
     def __init__(self, arrays: List[Union[PortArray, 'ShadowPortArray']], ignore_ports: Optional[List[str]] = None):
         self.ignored_ports = set(ignore_ports or [])
         self._children = arrays
@@ -124,10 +139,9 @@ class ShadowPortArray:
 
     @staticmethod
     def _gather_ports(arrays: List[Union[PortArray, 'ShadowPortArray']], ignored_ports: Set[str]):
-        ports = {}
+        ports = defaultdict(list)
         for array in arrays:
             for port in array.get_ports():
-                if port in ignored_ports:
-                    continue
-                ports.setdefault(port, []).append(array)
-        return ports
+                if port not in ignored_ports:
+                    ports[port].append(array)
+        return dict(ports)  # plain dict so lookups of unknown ports don't silently add entries
@@ -1,11 +1,16 @@
-import inspect
+import sys
+from types import MappingProxyType
 from typing import (
+    AbstractSet,
     Any,
+    Callable,
     Dict,
     Generic,
     List,
+    Mapping,
     TypeVar,
 )
+from weakref import WeakKeyDictionary
 
 from gasofo.dep_parser import parse_deps_used
 from gasofo.discoverable import (
@@ -38,12 +43,11 @@ def provides_with(name: str = None, **kwargs):
 
         Use this instead of @provides when exposing a port with a custom name or to tag on additional flags.
     """
-    PortArray.assert_valid_port_name(port_name=name)
     port_attrs = kwargs
 
     if name:
         PortArray.assert_valid_port_name(port_name=name)
-        port_attrs['with_name'] = name
+        port_attrs['with_name'] = sys.intern(name)
 
     def decorator(method):
         method.__port_attributes__ = port_attrs
@@ -57,6 +61,8 @@ REF_TYPE = TypeVar('REF_TYPE')
 
 
 class ProviderMetadata(Generic[REF_TYPE]):
+    __slots__ = ('_providers', '_flags')
+
     def __init__(self):
         self._providers: Dict[str, REF_TYPE] = {}
         self._flags: Dict[str, Any] = {}
@@ -70,9 +76,10 @@ class ProviderMetadata(Generic[REF_TYPE]):
         except KeyError:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
 
-    def get_provider_flags(self, port_name: str) -> dict:
+    def get_provider_flags(self, port_name: str) -> Mapping[str, Any]:
+        """Returns a read-only view of the flags rather than a copy. Copy it if you need to modify it."""
         try:
-            return self._flags[port_name].copy()
+            return MappingProxyType(self._flags[port_name])
         except KeyError:
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
 
@@ -83,6 +90,7 @@ class ProviderMetadata(Generic[REF_TYPE]):
             raise UnknownPort('"{}" is not a valid port'.format(port_name))
 
     def register_provider(self, port_name: str, provider: REF_TYPE, flags: dict):
+        port_name = sys.intern(port_name)
         if port_name in self._providers:
             raise DuplicateProviders('Duplicate providers for "{}"'.format(port_name))
 
@@ -92,6 +100,8 @@ class ProviderMetadata(Generic[REF_TYPE]):
 
 class ServiceProviderMetadata(ProviderMetadata[str]):
     """ meta that references provider by name """
+    __slots__ = ()
+
     def get_provider_method_name(self, port_name: str) -> str:
         try:
             return self._providers[port_name]
@@ -108,18 +118,42 @@ class ServiceMetaclass(type):
 
         mcs.validate_overridden_attributes(attrs=state, class_name=name)
 
-        # walk attributes and register the ones that have been tagged by @provides
+        deps = state.get('deps', None)
+        needs_ports_defined = deps._ports.keys() if deps else frozenset()
+        allowed_ports = needs_ports_defined | RESERVED_PORT_NAMES
+        all_deps_used = set()
+
+        # single walk of the class body that registers methods tagged by @provides and validates the deps they use
         meta = ServiceProviderMetadata()
         for attr_name, member in state.items():
-            if hasattr(member, '__port_attributes__') and callable(member):  # tagged
+            if not callable(member):
+                continue
 
-                port_name = member.__port_attributes__.get('with_name', attr_name)
+            port_attributes = getattr(member, '__dict__', {}).get('__port_attributes__')
+            if port_attributes is not None:  # tagged
+                port_name = port_attributes.get('with_name', attr_name)
                 PortArray.assert_valid_port_name(port_name)
-                meta.register_provider(port_name=port_name, provider=attr_name, flags=member.__port_attributes__)
+                meta.register_provider(port_name=port_name, provider=attr_name, flags=port_attributes)
+
+            deps_used = parse_deps_used(member)
+            if deps_used:
+                mcs._assert_deps_declared(
+                    deps_used=deps_used,
+                    allowed_ports=allowed_ports,
+                    class_name=name,
+                    attr_name=attr_name,
+                )
+                all_deps_used.update(deps_used)
 
-        mcs.validate_deps_declaration_and_usage(class_state=state, class_name=name)
+        unused_needs = needs_ports_defined - all_deps_used
+        if unused_needs:
+            raise UnusedPort('{} has unused Needs - {}'.format(name, ', '.join(sorted(unused_needs))))
 
         state['meta'] = meta
+        # ports are fixed once the class is created. Subclasses without their own deps inherit _gasofo_needs too.
+        state['_gasofo_provides'] = tuple(meta.get_provides())
+        if deps is not None:
+            state['_gasofo_needs'] = tuple(deps.get_ports())
         return type.__new__(mcs, name, bases, state)
 
     @classmethod
@@ -133,32 +167,27 @@ class ServiceMetaclass(type):
         if '__init__' in attrs:
             raise ServiceDefinitionError('To emphasize statelessness, {} should not define __init__'.format(class_name))
 
-    @classmethod
-    def validate_deps_declaration_and_usage(mcs, class_state: dict, class_name: str):
-        deps = class_state.get('deps', None)
-        needs_ports_defined = frozenset(deps.get_ports() if deps else ())
-        all_deps_used = set()
-
-        for attr_name, member in class_state.items():
-            if callable(member):
-                deps_used = parse_deps_used(member)
-                invalid_ports = deps_used.difference(needs_ports_defined).difference(RESERVED_PORT_NAMES)
-                all_deps_used.update(deps_used)
-                if invalid_ports:
-                    raise UnknownPort('{}.{} references undeclared Needs - {}'.format(
-                        class_name,
-                        attr_name,
-                        ', '.join(sorted(invalid_ports))
-                    ))
-
-        unused_needs = needs_ports_defined.difference(all_deps_used)
-        if unused_needs:
-            raise UnusedPort('{} has unused Needs - {}'.format(class_name, ', '.join(sorted(unused_needs))))
+    @staticmethod
+    def _assert_deps_declared(
+        deps_used: AbstractSet[str],
+        allowed_ports: AbstractSet[str],
+        class_name: str,
+        attr_name: str,
+    ):
+        invalid_ports = deps_used - allowed_ports
+        if invalid_ports:
+            raise UnknownPort('{}.{} references undeclared Needs - {}'.format(
+                class_name,
+                attr_name,
+                ', '.join(sorted(invalid_ports))
+            ))
 
 
 class Service(INeed, IProvide, metaclass=ServiceMetaclass):
 
     deps = Needs([])  # override me in subclass to define service needs
+    _gasofo_needs = ()  # populated by metaclass with the needs ports
+    _gasofo_provides = ()  # populated by metaclass with the provides ports
 
     def __init__(self):
         super(Service, self).__init__()
@@ -167,7 +196,7 @@ class Service(INeed, IProvide, metaclass=ServiceMetaclass):
     # ---- implement INeed ----
     @classmethod
     def get_needs(cls):
-        return cls.deps.get_ports()
+        return list(cls._gasofo_needs)
 
     def _is_compatible_provider(self, port_name, provider):
         return True  # no flag checking for now
@@ -179,7 +208,7 @@ class Service(INeed, IProvide, metaclass=ServiceMetaclass):
 
     @classmethod
     def get_provides(cls):
-        return cls.meta.get_provides()
+        return list(cls._gasofo_provides)
 
     def get_provider_func(self, port_name):
         meta = self.__class__.meta
@@ -195,16 +224,26 @@ class Service(INeed, IProvide, metaclass=ServiceMetaclass):
         return cls.meta.get_provider_flags(port_name)
 
 
-def get_template_funcs(service):
-    """Used by gasofo testing utils to assert calls are made with correct argspec."""
-    try:
-        if inspect.isclass(service):
-            deps = service.deps
-        else:
-            deps = service.__class__.deps
-        return deps._needs_template_funcs.copy()
-    except AttributeError:
-        return {port: unknown_interface for port in service.get_needs()}
+# template funcs are fixed once a class is created. Weak keys so classes defined within tests can still be collected.
+_template_funcs_cache: 'WeakKeyDictionary[type, Mapping[str, Callable]]' = WeakKeyDictionary()
+
+
+def get_template_funcs(service) -> Mapping[str, Callable]:
+    """Used by gasofo testing utils to assert calls are made with correct argspec.
+
+    Returns a read-only mapping that is shared by all callers asking about the same class.
+    """
+    service_class = service if isinstance(service, type) else service.__class__
+    template_funcs = _template_funcs_cache.get(service_class)
+    if template_funcs is None:
+        try:
+            needs_template_funcs = service_class.deps._needs_template_funcs
+        except AttributeError:
+            # needs may be resolved per instance so they are never cached
+            return MappingProxyType({port: unknown_interface for port in service.get_needs()})
+        template_funcs = MappingProxyType(dict(needs_template_funcs))
+        _template_funcs_cache[service_class] = template_funcs
+    return template_funcs
 
 
 def unknown_interface(self, *args, **kwargs):
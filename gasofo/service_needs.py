@@ -21,10 +21,9 @@ class Needs(PortArray):
             ports = [ports]
 
         for port in ports:
-            try:
-                self.add_port(port_name=port)
-            except DuplicatePortDefinition:
+            if port in self._ports:
                 raise DuplicatePortDefinition('"{}" port is duplicated'.format(port))
+            self.add_port(port_name=port)
 
 
 class NeedsInterfaceMetaclass(type):
@@ -52,7 +51,7 @@ class NeedsInterfaceMetaclass(type):
             # However, we do keep a reference to the original functions for debugging and testing purposes.
             needs[attr_name] = state.pop(attr_name)
 
-        state['_needs'] = list(needs.keys())
+        state['_needs'] = tuple(needs)  # immutable since it is shared by all instances of the interface
         state['_needs_template_funcs'] = needs
 
         # SHC: not sure this is a good ideal. Hide this away for now
@@ -1,12 +1,17 @@
-from gasofo.testing.adapters import attach_mock_provider
-from gasofo.testing.patchers import (
-    patch_port,
-    wrap_port,
-)
-from gasofo.testing.testcase_base import (
-    GasofoTestCase,
-    PortCall,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from gasofo._lazy import lazy_module_attributes as _lazy_module_attributes
+
+if _TYPE_CHECKING:  # pragma: no cover  (let IDEs and type checkers see the lazily loaded names)
+    from gasofo.testing.adapters import attach_mock_provider
+    from gasofo.testing.patchers import (
+        patch_port,
+        wrap_port,
+    )
+    from gasofo.testing.testcase_base import (
+        GasofoTestCase,
+        PortCall,
+    )
 
 __all__ = [
     'attach_mock_provider',
@@ -15,3 +20,14 @@ __all__ = [
     'patch_port',
     'wrap_port',
 ]
+
+# Submodules (and the mock library they use) are only imported when one of their public names is first accessed.
+_LAZY_IMPORTS = {
+    'attach_mock_provider': 'gasofo.testing.adapters',
+    'patch_port': 'gasofo.testing.patchers',
+    'wrap_port': 'gasofo.testing.patchers',
+    'GasofoTestCase': 'gasofo.testing.testcase_base',
+    'PortCall': 'gasofo.testing.testcase_base',
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS, __all__)
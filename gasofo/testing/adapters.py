@@ -1,5 +1,3 @@
-from unittest import mock
-
 from gasofo.convenience import object_as_provider
 from gasofo.discoverable import (
     INeed,
@@ -10,6 +8,7 @@ from gasofo.service import get_template_funcs
 
 
 def attach_mock_provider(consumer, ports):
+    from unittest import mock  # imported here so importing gasofo.testing does not pull in the mock library
     assert isinstance(consumer, INeed)
     assert isinstance(ports, (list, dict))
 
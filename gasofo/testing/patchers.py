@@ -1,5 +1,6 @@
 from builtins import object
 from unittest import mock
+from weakref import WeakKeyDictionary
 
 from gasofo import Service
 from gasofo.exceptions import (
@@ -62,6 +63,18 @@ def wrap_port(component, port_name):
 
 
 class PortPatcher(object):
+    __slots__ = (
+        'component',
+        'port_name',
+        'wraps_provider',
+        '_patches',
+        'is_started',
+        'side_effect',
+        'return_value',
+        'provider',
+        'targets',
+    )
+
     def __init__(self, component, port_name, wraps_provider=False, side_effect=None, return_value=mock.DEFAULT):
         self.component = component
         self.port_name = port_name
@@ -113,16 +126,9 @@ class PortPatcher(object):
         self.stop()
         return False
 
-    def _find_services_that_needs_port(self, component, port_name):
-        if isinstance(component, Service) and port_name in component.get_needs():
-            return [component]
-
-        found = []
-        service_map = getattr(component, '_service_map', {})
-        for child_instance in list(service_map.values()):
-            found.extend(self._find_services_that_needs_port(component=child_instance, port_name=port_name))
-
-        return found
+    @staticmethod
+    def _find_services_that_needs_port(component, port_name):
+        return list(_get_services_by_needs_port(component).get(port_name, ()))
 
     @staticmethod
     def _get_common_provider(services, port_name):
@@ -141,3 +147,34 @@ class PortPatcher(object):
             provider = port_method
 
         return provider
+
+
+# The services within a domain, and their needs, are fixed once it is created so index them once per domain.
+_services_by_needs_port_cache = WeakKeyDictionary()
+
+
+def _get_services_by_needs_port(component):
+    if isinstance(component, Service):  # not cached since the index would hold a strong reference to its own key
+        return {port_name: [component] for port_name in component.get_needs()}
+    try:
+        return _services_by_needs_port_cache[component]
+    except KeyError:
+        index = _services_by_needs_port_cache[component] = _index_services_by_needs_port(component)
+        return index
+    except TypeError:  # cannot be weakly referenced (e.g. slotted ad-hoc providers) so don't cache
+        return _index_services_by_needs_port(component)
+
+
+def _index_services_by_needs_port(component):
+    """ Maps each needs port to the services within the component (in depth-first order) that need it. """
+    index = {}
+    pending = [component]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, Service):
+            for port_name in current.get_needs():
+                index.setdefault(port_name, []).append(current)
+        else:
+            service_map = getattr(current, '_service_map', {})
+            pending.extend(reversed(list(service_map.values())))  # reversed so children are visited in order
+    return index
@@ -26,7 +26,7 @@ class OrdersServiceOpenForOrdersTest(GasofoTestCase):
         active_order_for_room = OrderSummary(order_id='id001', buyer='Nicolas', room='Le trou des chouettes')
         self.GIVEN(needs_port='db_get_active_order', returns=active_order_for_room)
 
-        with self.assertRaisesRegexp(InvalidAction, 'There is already an offer to by coffee by Nicolas'):
+        with self.assertRaisesRegexp(InvalidAction, 'There is already an offer to buy coffee by Nicolas'):
             self.WHEN(port_called='open_for_orders', requester='Shawn', room='Le trou des chouettes')
 
     def test_raises_if_is_already_an_open_order_for_room_by_same_buyer(self):
@@ -0,0 +1,16 @@
+from unittest import TestCase
+
+from example.helpers.uuid import UuidGenerator
+
+
+class UuidGeneratorTest(TestCase):
+
+    def test_ids_are_prefixed_and_padded_and_continue_across_batches(self):
+        generator = UuidGenerator(prefix='X', start=9, width=2, batch_size=2)
+
+        ids = [generator.get_next_unique_id() for _ in range(3)]
+        self.assertEqual(['X09', 'X10', 'X11'], ids)
+
+    def test_batch_size_must_be_at_least_one(self):
+        with self.assertRaisesRegex(ValueError, 'batch_size must be at least 1'):
+            UuidGenerator(batch_size=0)
@@ -1,3 +1,6 @@
+import gc
+import weakref
+from functools import wraps
 from unittest import TestCase
 # ====== uncomment the following to test old regex based parser ====
 # import os
@@ -74,12 +77,28 @@ class TestParseDepsUsed(TestCase):
 
         self.assertEqual({'yes'}, parse_deps_used(dummy))
 
+    def test_can_handle_calls_in_fstring_replacement_fields(self):
+        def dummy(self):
+            a = f"{self.deps.yes1()} self.deps.no1()"
+            b = f'{{self.deps.no2()}} {self.deps.yes2(x="#")!r:>10}'
+            c = F"""
+            {self.deps.yes3()}
+            """
+
+        self.assertEqual({'yes1', 'yes2', 'yes3'}, parse_deps_used(dummy))
+
     def test_can_handle_chained_calls(self):
         def dummy(self):
             return self.deps.a().append(1)
 
         self.assertEqual({'a'}, parse_deps_used(dummy))
 
+    def test_can_handle_calls_on_returned_callables(self):
+        def dummy(self):
+            return self.deps.a()(self.deps.b())
+
+        self.assertEqual({'a', 'b'}, parse_deps_used(dummy))
+
     def test_can_handle_calls_within_args_and_kwargs(self):
         def dummy(self):
             return self.deps.a(
@@ -139,5 +158,47 @@ class TestParseDepsUsed(TestCase):
 
         self.assertEqual({'a', 'b'}, parse_deps_used(dummy))
 
+    def test_results_are_cached_per_code_object(self):
+        def dummy(self):
+            return self.deps.a()
+
+        class A:
+            method = dummy
+
+        class B:
+            method = dummy
+
+        self.assertIs(parse_deps_used(A.method), parse_deps_used(B.method))
+
+    def test_cached_results_do_not_keep_code_alive(self):
+        namespace = {}
+        exec('def dummy(self):\n    return self.no_deps_here()\n', namespace)  # code not held as a constant elsewhere
+
+        self.assertEqual(frozenset(), parse_deps_used(namespace['dummy']))
+        code_ref = weakref.ref(namespace.pop('dummy').__code__)
+        gc.collect()
+        self.assertIsNone(code_ref())
+
+    def test_decorated_methods_are_cached_by_their_own_source(self):
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+            return wrapper
+
+        @decorator
+        def dummy_a(self):
+            return self.deps.a()
+
+        @decorator
+        def dummy_b(self):
+            return self.deps.b()
+
+        self.assertEqual({'a'}, parse_deps_used(dummy_a))
+        self.assertEqual({'b'}, parse_deps_used(dummy_b))
 
+    def test_source_is_not_needed_when_code_does_not_reference_deps(self):
+        namespace = {}
+        exec('def dummy(self):\n    return self.no_deps_here()\n', namespace)  # no source file to read from
 
+        self.assertEqual(frozenset(), parse_deps_used(namespace['dummy']))
@@ -163,6 +163,17 @@ class AutoDiscoverAndWiringTest(TestCase):
         with self.assertRaisesRegexp(DuplicateProviders, 'Duplicate providers for "x".*'):
             AutoDiscoverConnections([X(), Axe()])
 
+    def test_DuplicateProviders_raised_when_the_same_component_is_listed_twice(self):
+
+        class X(Service):
+            @provides
+            def x(self):
+                return 'X'
+
+        component = X()
+        with self.assertRaisesRegexp(DuplicateProviders, 'Duplicate providers for "x".*'):
+            AutoDiscoverConnections([component, component])
+
 
 class INeedTest(TestCase):
 
@@ -12,6 +12,7 @@ from gasofo.domain import (
 from gasofo.exceptions import (
     DisconnectedPort,
     DomainDefinitionError,
+    DuplicateProviders,
     InconsistentInterface,
     UnknownPort,
 )
@@ -62,6 +63,18 @@ class DomainDefinitionTest(TestCase):
                 __services__ = []
                 __provides__ = None
 
+    def test_service_listed_twice_in_domain_raises_DuplicateProviders(self):
+
+        class SimpleService(Service):
+            @provides
+            def bark(self):
+                return 'woof'
+
+        with self.assertRaisesRegexp(DuplicateProviders, 'Duplicate providers for "bark".*'):
+            class RepetitiveDomain(Domain):
+                __services__ = [SimpleService, SimpleService]
+                __provides__ = ['bark']
+
     def test_simple_domain_with_provides_but_no_needs(self):
 
         class SimpleService(Service):
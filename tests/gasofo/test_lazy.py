@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+class LazyPackageAttributesTest(TestCase):
+    """ Run in a fresh interpreter since other tests will have already imported the submodules. """
+
+    def assert_runs_in_fresh_interpreter(self, code):
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        self.assertEqual(0, result.returncode, result.stderr)
+        return result.stdout.strip()
+
+    def test_public_names_are_loaded_on_first_access(self):
+        output = self.assert_runs_in_fresh_interpreter(
+            'import sys, gasofo\n'
+            'print("gasofo.service" in sys.modules)\n'
+            'print(gasofo.Service.__module__)\n'
+        )
+        self.assertEqual('False\ngasofo.service', output)
+
+    def test_submodules_can_be_reached_from_bare_package_import(self):
+        output = self.assert_runs_in_fresh_interpreter(
+            'import gasofo\n'
+            'print("meta" in gasofo.ports.RESERVED_PORT_NAMES)\n'
+            'print(gasofo.exceptions.UnknownPort.__name__)\n'
+            'print(gasofo.testing.patchers.__name__)\n'
+        )
+        self.assertEqual('True\nUnknownPort\ngasofo.testing.patchers', output)
+
+    def test_unknown_attribute_raises_AttributeError(self):
+        output = self.assert_runs_in_fresh_interpreter(
+            'import gasofo\n'
+            'print(hasattr(gasofo, "no_such_thing"))\n'
+            'print(hasattr(gasofo.testing, "no_such_thing"))\n'
+        )
+        self.assertEqual('False\nFalse', output)
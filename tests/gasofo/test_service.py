@@ -1,4 +1,5 @@
 import inspect
+import sys
 from unittest import TestCase
 
 from gasofo.exceptions import (
@@ -267,6 +268,29 @@ class ServiceProvidesTest(TestCase):
         self.assertEqual(expected_flags, MyService.get_provider_flags('provider_b'))
         self.assertEqual(expected_flags, MyService().get_provider_flags('provider_b'))
 
+    def test_getting_provider_flags_on_port_with_flags_but_no_custom_name(self):
+
+        class MyService(Service):
+            @provides_with(web_only=True)
+            def provider_a(self):
+                return 'A'
+
+        expected_flags = {'web_only': True}
+        self.assertEqual(['provider_a'], MyService.get_provides())
+        self.assertEqual(expected_flags, MyService.get_provider_flags('provider_a'))
+        self.assertEqual('A', MyService().get_provider_func('provider_a')())
+
+    def test_custom_port_names_are_interned(self):
+        port_name = ''.join(['provider', '_b'])  # built at runtime so it is not interned by the compiler
+
+        class MyService(Service):
+            @provides_with(name=port_name)
+            def another_provider(self):
+                return 'B'
+
+        self.assertIs(sys.intern(port_name), MyService.get_provides()[0])
+        self.assertIs(sys.intern(port_name), MyService.get_provider_flag('provider_b', 'with_name'))
+
     def test_querying_a_specific_provider_flag(self):
 
         class MyService(Service):
@@ -396,5 +420,19 @@ class ServiceTemplateFuncTest(TestCase):
         self.assert_has_same_argspec(lambda self, *args, **kwargs: None, func)
         self.assertRaises(NotImplementedError, func, None)  # template func meant as unbound methods so expects a 'self'
 
+    def test_consumer_without_template_funcs_has_needs_resolved_per_instance(self):
+        class MyConsumer(object):
+            def __init__(self, needs):
+                self.needs = needs
+
+            def get_needs(self):
+                return self.needs
+
+        template_funcs = get_template_funcs(service=MyConsumer(needs=['a']))
+        self.assertCountEqual(['a'], list(template_funcs.keys()))
+
+        template_funcs = get_template_funcs(service=MyConsumer(needs=['b', 'c']))
+        self.assertCountEqual(['b', 'c'], list(template_funcs.keys()))
+
     def assert_has_same_argspec(self, func1, func2):
         self.assertEqual(inspect.getfullargspec(func=func1), inspect.getfullargspec(func=func2))
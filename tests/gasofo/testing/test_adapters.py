@@ -56,6 +56,23 @@ class AttachMockProviderTest(TestCase):
 
         provider.a.assert_called_once_with()
 
+    def test_mocked_ports_do_not_accept_arbitrary_attributes(self):
+
+        class MyService(Service):
+            deps = Needs(['a'])
+
+            @provides
+            def get_a(self):
+                return self.deps.a()
+
+        service = MyService()
+        provider = attach_mock_provider(consumer=service, ports=['a'])
+
+        with self.assertRaises(AttributeError):
+            provider.a.bogus_attr = 1
+        with self.assertRaises(AttributeError):
+            provider.bogus_attr = 1
+
     def test_argspecs_are_validated_when_called_via_mock_provider(self):
 
         class MyServiceNeeds(NeedsInterface):
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from unittest import TestCase
 
 from unittest import mock
@@ -98,6 +100,25 @@ class PatchPortTest(TestCase):
         patcher.stop()
         self.assertEqual(9 * 10 + 5, domain.a(9))  # patch removed once stopped
 
+    def test_patched_service_can_still_be_garbage_collected(self):
+
+        class A(Service):
+            deps = Needs(['b'])
+
+            @provides
+            def a(self, value):
+                return self.deps.b(value=value)
+
+        service = A()
+        service.set_provider(port_name='b', provider=func_as_provider(func=lambda value: value, port='b'))
+        with patch_port(component=service, port_name='b'):
+            pass
+
+        service_ref = weakref.ref(service)
+        del service
+        gc.collect()
+        self.assertIsNone(service_ref())
+
     def test_patch_port_affects_all_consumers_of_a_port(self):
         domain = get_domain()
 